@@ -1,2 +1,2 @@
-from media_toolkit.core import MediaFile, ImageFile, VideoFile, AudioFile
+from media_toolkit.core import MediaFile, MediaFileBatch, ImageFile, VideoFile, AudioFile
 from media_toolkit.utils.file_conversion import media_from_file, media_from_any
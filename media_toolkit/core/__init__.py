@@ -1,4 +1,5 @@
 from .media_file import MediaFile
+from .media_file_batch import MediaFileBatch
 from .image_file import ImageFile
 from .audio_file import AudioFile
 from .video.video_file import VideoFile
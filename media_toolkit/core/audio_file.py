@@ -2,7 +2,7 @@ from media_toolkit.utils.dependency_requirements import requires
 from media_toolkit.core.media_file import MediaFile
 import io
 
-from media_toolkit.utils.generator_wrapper import SimpleGeneratorWrapper
+from media_toolkit.utils.generator_wrapper import SimpleGeneratorWrapper, prefetch_generator
 
 try:
     import soundfile
@@ -21,12 +21,30 @@ class AudioFile(MediaFile):
 
     @requires('soundfile')
     def to_np_array(self, sr: int = None, return_sample_rate: bool = False):
+        """
+        :param sr: Target sample rate. If it differs from the native rate the audio is resampled with soxr.
+        :param return_sample_rate: If True also returns the sample rate of the returned audio.
+        """
         self._content_buffer.seek(0)
-        audio, sr = soundfile.read(self._content_buffer, samplerate=sr)  # sr=None returns the native sample rate
+        audio, native_sr = soundfile.read(self._content_buffer)
+        if sr is not None and sr != native_sr:
+            # libsndfile does not resample; soxr is a SIMD optimized resampler
+            try:
+                import soxr
+            except ImportError:
+                raise ImportError("soxr is not installed. Please install soxr to resample audio.")
+            audio = soxr.resample(audio, native_sr, sr, quality='HQ')
+        else:
+            sr = native_sr
         if return_sample_rate:
             return audio, sr
         return audio
 
+    @property
+    def __array_interface__(self):
+        # np.asarray should yield the decoded samples via __array__, not the raw encoded bytes
+        raise AttributeError("__array_interface__")
+
     @requires('soundfile')
     def from_np_array(self, np_array, sr: int = 44100, file_type: str = "wav"):
         sr = 44100 if sr is None else sr  # 22050
@@ -37,22 +55,29 @@ class AudioFile(MediaFile):
         return super().from_file(virtual_file)
 
     @requires('soundfile')
-    def to_stream(self, chunks_per_second: int = 10):
+    def to_stream(self, chunks_per_second: int = 10, prefetch: int = 4):
         """
         Generator that yields audio chunks of 1/chunks_per_second as numpy arrays.
         :param chunks_per_second: Number of chunks per second
+        :param prefetch: Number of chunks a background thread decodes ahead of the consumer.
+            This overlaps decoding with whatever the consumer does (e.g. inference). 0 disables it.
         :return: Generator that yields numpy arrays with audio data.
         """
 
-        audio, sample_rate = self.to_soundfile()
+        # stream decoded blocks directly from the buffer instead of decoding the whole file upfront.
+        # memory stays O(chunk_size) and the first chunk is available immediately.
+        self._content_buffer.seek(0)
+        info = soundfile.info(self._content_buffer)
+        sample_rate = info.samplerate
         chunk_size = sample_rate // chunks_per_second
-        n_chunks = len(audio) // chunk_size + 1
+        n_chunks = -(-info.frames // chunk_size)  # ceil division
 
-        def generator():
-            for i in range(n_chunks):
-                chunk = audio[i * chunk_size: i * chunk_size + chunk_size]
-                yield chunk.astype(np.float32) #.tobytes()
+        self._content_buffer.seek(0)
+        # fill_value pads the last block with silence so every chunk has the same shape
+        blocks = soundfile.blocks(self._content_buffer, blocksize=chunk_size, dtype='float32', fill_value=0.0)
+        if prefetch and prefetch > 0:
+            blocks = prefetch_generator(blocks, buffer_size=prefetch)
 
-        g = SimpleGeneratorWrapper(generator=generator(), length=n_chunks)
+        g = SimpleGeneratorWrapper(generator=blocks, length=n_chunks)
         g.sample_rate = sample_rate
         return g
@@ -1,3 +1,6 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 from media_toolkit.utils.dependency_requirements import requires_numpy, requires_cv2, requires
 from media_toolkit.core.media_file import MediaFile
 
@@ -7,6 +10,34 @@ try:
 except ImportError:
     pass
 
+try:
+    # optional: libjpeg-turbo is 2-3x faster than the libjpeg used by cv2 for jpeg encode/decode
+    from turbojpeg import TurboJPEG
+    _turbo_jpeg = TurboJPEG()
+except Exception:
+    _turbo_jpeg = None
+
+
+@requires('cv2', 'numpy')
+def encode_batch(arrays, img_type: str = 'png', encode_params: list = None, max_workers: int = None):
+    """
+    Encodes a batch of images (numpy arrays, BGR) in a thread pool and returns the encoded bytes
+    in order. cv2.imencode releases the GIL, so the SIMD-heavy encode scales across cores --
+    useful when building many ImageFiles from a video pipeline.
+    :param encode_params: cv2.imencode parameters, e.g. [cv2.IMWRITE_PNG_COMPRESSION, 1].
+    """
+    if encode_params is None:
+        encode_params = [int(cv2.IMWRITE_JPEG_QUALITY), 90] if img_type in ("jpg", "jpeg") else []
+
+    def _encode(array):
+        is_success, buffer = cv2.imencode(f".{img_type}", np.asarray(array), encode_params)
+        if not is_success:
+            raise ValueError(f"Could not encode array to {img_type} image")
+        return buffer.tobytes()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(_encode, arrays))
+
 
 class ImageFile(MediaFile):
     """
@@ -14,29 +45,73 @@ class ImageFile(MediaFile):
     Internally it uses cv2 file format.
     """
     @requires('cv2', 'numpy')
-    def from_np_array(self, np_array, img_type: str = None):
-        if isinstance(np_array, list):
-            np_array = np.array(np_array)
+    def from_np_array(self, np_array, img_type: str = None, encode_params: list = None):
+        """
+        :param np_array: The image as numpy array (BGR) or nested list.
+        :param img_type: The target format ("jpeg", "png", ...). Defaults based on content type.
+        :param encode_params: Optional cv2.imencode parameter list, e.g.
+            [cv2.IMWRITE_PNG_COMPRESSION, 1] to trade a little size for a much faster encode.
+        """
+        np_array = np.asarray(np_array)  # no-op for ndarray inputs; converts lists once
+        channels = 1 if np_array.ndim == 2 else (np_array.shape[2] if np_array.ndim == 3 else None)
 
         if img_type is None:
             if "image/" not in self.content_type:
-                img_type, self._channels = self.detect_image_type_and_channels(np_array)
+                # jpeg encodes much faster and smaller than png; overridable via env var
+                img_type = os.environ.get("MEDIA_TOOLKIT_IMAGE_FORMAT", "jpeg").lower()
+                if channels == 4:
+                    img_type = "png"  # jpeg can't store an alpha channel
             else:
                 img_type = self.content_type.split("/")[1]
             self.content_type = f"image/{img_type}"
 
-        is_success, buffer = cv2.imencode(f".{img_type}", np_array)
+        if img_type in ("jpg", "jpeg") and encode_params is None and _turbo_jpeg is not None \
+                and np_array.ndim == 3 and np_array.shape[2] == 3:
+            try:
+                encoded = _turbo_jpeg.encode(np.ascontiguousarray(np_array), quality=90)
+                self._reset_buffer()
+                self._content_buffer.write(encoded)
+                self._content_buffer.seek(0)
+                self._file_info()
+                self._channels = channels  # known from the input shape; no decode needed later
+                return self
+            except Exception:
+                pass  # fall back to cv2
+
+        if encode_params is None:
+            encode_params = [int(cv2.IMWRITE_JPEG_QUALITY), 90] if img_type in ("jpg", "jpeg") else []
+        is_success, buffer = cv2.imencode(f".{img_type}", np_array, encode_params)
         if is_success:
-            # avoid to check again for image type by calling super().from_bytes instead of self.from_bytes
-            return super().from_bytes(buffer)
+            # write the encoded ndarray through a memoryview; avoids an implicit tobytes() copy
+            self._reset_buffer()
+            self._content_buffer.write(memoryview(buffer))
+            self._content_buffer.seek(0)
+            self._file_info()
+            self._channels = channels  # known from the input shape; no decode needed later
+            return self
         else:
             raise ValueError(f"Could not convert np_array to {img_type} image")
 
 
     @requires('numpy', 'cv2')
     def to_np_array(self):
-        bytes = self.to_bytes()
-        return cv2.imdecode(np.frombuffer(bytes, np.uint8), -1)
+        # zero-copy view on the encoded bytes; to_bytes() would copy the whole file first
+        view = self._read_view()
+        # turbojpeg always emits 3-channel BGR; only use it when the image is known to be
+        # 3-channel, otherwise grayscale JPEGs would change shape depending on whether the
+        # optional package is installed (cv2 IMREAD_UNCHANGED keeps them 2-D)
+        if _turbo_jpeg is not None and getattr(self, "_channels", None) == 3 \
+                and bytes(view[:2]) == b'\xff\xd8':
+            try:
+                return _turbo_jpeg.decode(view)  # BGR, like cv2
+            except Exception:
+                pass  # fall back to cv2
+        return cv2.imdecode(np.frombuffer(view, np.uint8), cv2.IMREAD_UNCHANGED)
+
+    @property
+    def __array_interface__(self):
+        # np.asarray should yield the decoded image via __array__, not the raw encoded bytes
+        raise AttributeError("__array_interface__")
 
     @requires_numpy()
     def to_cv2_img(self):
@@ -48,43 +123,61 @@ class ImageFile(MediaFile):
 
     def _file_info(self):
         super()._file_info()
-        np_array = self.to_np_array()
-
-        img_type, self._channels = self.detect_image_type_and_channels(np_array)
+        # type detection is a magic-byte compare on the encoded header -- no decode.
+        # channel count is deferred to the channels property, which decodes only when asked.
+        header = bytes(self._read_view()[:16])
+        img_type, _ = self.detect_image_type_and_channels(None, header=header)
         if img_type is not None:
             self.content_type = f"image/{img_type}"
-        
+
+    def _invalidate_info(self):
+        self._channels = None
+
+    @property
+    def channels(self) -> int:
+        """Number of color channels. Decodes the image once on first access when it wasn't
+        already known from ingestion."""
+        if getattr(self, "_channels", None) is None:
+            img = self.to_np_array()
+            self._channels = 1 if img is None or img.ndim == 2 else img.shape[2]
+        return self._channels
 
     @staticmethod
-    def detect_image_type_and_channels(image) -> (str, int):
-        """Detect the image type and number of _channels from a numpy array."""
-        if isinstance(image, list):
-            image = np.array(image)
-
-        # Check the number of _channels
-        if len(image.shape) == 2:
-            channels = 1  # Grayscale
-        elif len(image.shape) == 3:
-            channels = image.shape[2]
-        else:
-            #raise ValueError("Unsupported image shape: {}".format(image.shape))
-            return None, None
+    def detect_image_type_and_channels(image, header: bytes = None) -> (str, int):
+        """
+        Detect the number of _channels from a numpy array and the image type from the file signature.
+        :param image: The decoded image as numpy array; used for channel detection.
+            If None, only the type is detected.
+        :param header: The first bytes of the encoded file. If None, the image type is not detected.
+        """
+        channels = None
+        if image is not None:
+            image = np.asarray(image)  # no-op when the caller already passes an ndarray
+
+            # Check the number of _channels
+            if len(image.shape) == 2:
+                channels = 1  # Grayscale
+            elif len(image.shape) == 3:
+                channels = image.shape[2]
+            else:
+                #raise ValueError("Unsupported image shape: {}".format(image.shape))
+                return None, None
 
-        # Detect image type by checking for specific markers
+        # Detect image type by checking the magic numbers of the encoded bytes
         image_type = None
-
-        # Convert to bytes and inspect file signatures for format detection
-        success, encoded_image = cv2.imencode('.png', image)
-        if success:
-            encoded_bytes = encoded_image.tobytes()
-            if encoded_bytes.startswith(b'\x89PNG\r\n\x1a\n'):
+        if header:
+            if header.startswith(b'\x89PNG\r\n\x1a\n'):
                 image_type = 'png'
-            elif encoded_bytes[0:2] == b'\xff\xd8':
+            elif header[0:2] == b'\xff\xd8':
                 image_type = 'jpeg'
-            elif encoded_bytes.startswith(b'BM'):
+            elif header.startswith(b'BM'):
                 image_type = 'bmp'
-            elif encoded_bytes.startswith(b'GIF'):
+            elif header.startswith(b'GIF8'):
                 image_type = 'gif'
+            elif header[:4] == b'RIFF' and header[8:12] == b'WEBP':
+                image_type = 'webp'
+            elif header[:4] in (b'II*\x00', b'MM\x00*'):
+                image_type = 'tiff'
 
         return image_type, channels
 
@@ -1,6 +1,10 @@
 import base64
+import binascii
+import functools
 import io
 import mimetypes
+import mmap
+import shutil
 
 from typing import Union, BinaryIO
 import os
@@ -15,6 +19,42 @@ try:
 except ImportError:
     pass
 
+# structural base64 check; precompiled once because it runs on every from_any / from_base64 call
+_BASE64_RE = re.compile(rb'^[A-Za-z0-9+/]*={0,2}$')
+
+# the extensions this toolkit actually handles; a dict hit skips the mimetypes DB entirely
+_FAST_MIME = {
+    'mp4': 'video/mp4', 'webm': 'video/webm', 'mkv': 'video/x-matroska', 'avi': 'video/x-msvideo',
+    'mov': 'video/quicktime',
+    'mp3': 'audio/mpeg', 'wav': 'audio/x-wav', 'flac': 'audio/flac', 'ogg': 'audio/ogg',
+    'png': 'image/png', 'jpg': 'image/jpeg', 'jpeg': 'image/jpeg', 'gif': 'image/gif',
+    'bmp': 'image/bmp', 'webp': 'image/webp', 'tiff': 'image/tiff',
+    'json': 'application/json', 'html': 'text/html', 'css': 'text/css', 'txt': 'text/plain',
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _guess_content_type(ext: str) -> str:
+    """Memoized content-type lookup keyed on the lowercased file extension. Common media
+    extensions resolve from the table above; only unknown ones hit the mimetypes DB."""
+    return _FAST_MIME.get(ext) or mimetypes.guess_type("x." + ext)[0] or "application/octet-stream"
+
+
+# shared across from_url calls so repeated downloads from the same host reuse their TCP/TLS connections
+_session = None
+
+
+def _get_requests_session():
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        _session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+        _session.mount("http://", adapter)
+        _session.mount("https://", adapter)
+    return _session
+
 
 class MediaFile:
     """
@@ -31,6 +71,18 @@ class MediaFile:
         self.file_name = file_name  # the name of the file also when specified in bytesio
         self.path = None  # the path of the file if it was provided. Is also indicator if file was loaded from file.
         self._content_buffer = io.BytesIO()
+        # set while loading when the caller already provided the metadata (upload / response headers);
+        # makes the base _file_info a no-op so correct metadata isn't overwritten by guesses.
+        self._skip_file_info = False
+
+    # exact-type jump table for from_any. Stores method names so subclasses (e.g. ImageFile.from_np_array)
+    # are still dispatched to. np.ndarray is added below if numpy is installed.
+    _FROM_ANY_DISPATCH = {
+        io.BytesIO: 'from_bytesio_or_handle',
+        io.BufferedReader: 'from_bytesio_or_handle',
+        bytes: 'from_bytes',
+        str: '_from_string',
+    }
 
     def from_any(self, data):
         """
@@ -40,19 +92,17 @@ class MediaFile:
         if isinstance(data, MediaFile):
             return data
 
-        # conversion factory
-        if type(data) in [io.BufferedReader, io.BytesIO]:
+        # conversion factory: O(1) lookup for the common exact types
+        handler = self._FROM_ANY_DISPATCH.get(type(data))
+        if handler is not None:
+            getattr(self, handler)(data)
+            return self
+
+        # fallback chain for subclasses and types that may not be importable (numpy, starlette)
+        if isinstance(data, (io.BufferedReader, io.BytesIO)):
             self.from_bytesio_or_handle(data)
         elif isinstance(data, str):
-            if self._is_valid_file_path(data):
-                self.from_file(data)
-            elif self._is_url(data):
-                self.from_url(data)
-            else:
-                try:
-                    self.from_base64(data)
-                except Exception as e:
-                    print(f"Either wrong file path or not base64. Check your inputs: {data}. Error: {e}")
+            self._from_string(data)
         elif isinstance(data, bytes):
             self.from_bytes(data)
         elif type(data).__name__ == 'ndarray':
@@ -62,6 +112,20 @@ class MediaFile:
 
         return self
 
+    def _from_string(self, data: str):
+        """
+        Route a string to from_file, from_url or from_base64 depending on what it looks like.
+        """
+        if self._is_valid_file_path(data):
+            return self.from_file(data)
+        elif self._is_url(data):
+            return self.from_url(data)
+
+        try:
+            return self.from_base64(data)
+        except Exception as e:
+            print(f"Either wrong file path or not base64. Check your inputs: {data}. Error: {e}")
+
     def from_bytesio_or_handle(
             self,
             buffer: Union[io.BytesIO, BinaryIO, io.BufferedReader],
@@ -73,14 +137,14 @@ class MediaFile:
         :params copy: If true, the buffer is completely read to bytes and the bytes copied to this file.
             If false file works with the provided buffer. Danger -- The buffer is kept open.
         """
-        if not type(buffer) in [io.BytesIO, io.BufferedReader]:
+        if not isinstance(buffer, (io.BytesIO, io.BufferedReader)):
             raise ValueError(f"Buffer must be of type BytesIO or BufferedReader. Got {type(buffer)}")
 
         self._reset_buffer()
         buffer.seek(0)
 
         # setting path is needed in order that file_info can work properly
-        if type(buffer) in [io.BufferedReader]:
+        if isinstance(buffer, io.BufferedReader):
             self.path = buffer.name
 
         if not copy:
@@ -88,6 +152,11 @@ class MediaFile:
             self._file_info()
         else:
             self.from_bytes(buffer.read())  # calls self._file_info also
+            if isinstance(buffer, io.BufferedReader):
+                # from_bytes cleared the path, but these bytes do come from that file;
+                # restore it and re-derive the metadata it carries
+                self.path = buffer.name
+                self._file_info()
             buffer.seek(0)
 
         return self
@@ -99,11 +168,14 @@ class MediaFile:
     # @overload
     # def from_file(path_or_handle: Union[str, io.BytesIO, io.BufferedReader]):
     #    return MediaFile().from_file(path_or_handle)
-    def from_file(self, path_or_handle: Union[str, io.BytesIO, io.BufferedReader]):
+    def from_file(self, path_or_handle: Union[str, io.BytesIO, io.BufferedReader], use_mmap: bool = False):
         """
         Load a file from a file path, file handle or base64 and convert it to BytesIO.
+        :param use_mmap: memory-map path inputs instead of reading them into a private buffer.
+            Zero-copy: the OS page cache backs the content, so multi-GB files "load" instantly
+            and only the touched pages occupy RAM. The content is read-only in this mode.
         """
-        if type(path_or_handle) in [io.BufferedReader, io.BytesIO]:
+        if isinstance(path_or_handle, (io.BufferedReader, io.BytesIO)):
             self.from_bytesio_or_handle(path_or_handle)
         elif isinstance(path_or_handle, str):
             # read file from path
@@ -112,16 +184,33 @@ class MediaFile:
 
             self.path = path_or_handle
             # self.content_type = mimetypes.guess_type(self.file_name)[0] or "application/octet-stream"
-            with open(path_or_handle, 'rb') as file:
-                self.from_bytesio_or_handle(file)  # method also calls self._file_info.
+            if use_mmap and os.path.getsize(path_or_handle) > 0:
+                self._reset_buffer()
+                with open(path_or_handle, 'rb') as file:
+                    # the mapping dups the fd, so closing the handle here is fine
+                    self._content_buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                self._file_info()
+            else:
+                with open(path_or_handle, 'rb') as file:
+                    self.from_bytesio_or_handle(file)  # method also calls self._file_info.
 
         return self
 
-    def from_bytes(self, data: bytes):
-        self._reset_buffer()
-        self._content_buffer.write(data)
-        self._content_buffer.seek(0)
-        self._file_info()
+    def from_bytes(self, data: bytes, _infer: bool = True):
+        """
+        :param data: The bytes to load.
+        :param _infer: If False, file name and content type are not guessed from the buffer
+            because the caller already set them.
+        """
+        self._invalidate_info()
+        self.path = None  # content no longer comes from a file on disk
+        # BytesIO(bytes) shares the immutable buffer until the first write -- no memcpy
+        self._content_buffer = io.BytesIO(data)
+        self._skip_file_info = not _infer
+        try:
+            self._file_info()
+        finally:
+            self._skip_file_info = False
         return self
 
     def from_starlette_upload_file(self, starlette_upload_file):
@@ -130,11 +219,11 @@ class MediaFile:
         :param starlette_upload_file:
         :return:
         """
-        # in file info all the meta is retrieved from the file.name in case of buffered reader
         content = starlette_upload_file.file.read()
+        # the upload already carries the authoritative metadata; don't let _file_info guess over it
         self.file_name = starlette_upload_file.filename
         self.content_type = starlette_upload_file.content_type
-        self.from_bytes(content)
+        self.from_bytes(content, _infer=False)
         return self
 
     def from_base64(self, base64_str: str):
@@ -142,20 +231,43 @@ class MediaFile:
         Load a file which was encoded as a base64 string.
         """
 
-        decoded = self._decode_base_64_if_is(base64_str)
-        if decoded is not None:
-            return self.from_bytes(base64.b64decode(base64_str))
-        else:
+        encoded = self._decode_base_64_if_is(base64_str)
+        if encoded is None:
             err_str = base64_str if len(base64_str) <= 50 else base64_str[:50] + "..."
             raise ValueError(f"Decoding from base64 like string {err_str} was not possible. Check your data.")
 
+        # decode chunk wise into the buffer to avoid holding the payload in memory twice.
+        # chunks must be multiples of 4 chars so padding only occurs in the last chunk.
+        chunk_size = 1024 * 1024  # 1 MiB of base64 chars -> 768 KiB of bytes
+        self._reset_buffer()
+        self.path = None  # content no longer comes from a file on disk
+        if len(encoded) > chunk_size:
+            # presize the buffer to the decoded size so chunk writes never grow-reallocate;
+            # the estimate overshoots by at most the 2 padding bytes and is trimmed below
+            self._content_buffer.seek((len(encoded) // 4) * 3 - 1)
+            self._content_buffer.write(b"\x00")
+            self._content_buffer.seek(0)
+        view = memoryview(encoded)  # slicing the bytes directly would copy each chunk
+        for i in range(0, len(encoded), chunk_size):
+            self._content_buffer.write(binascii.a2b_base64(view[i: i + chunk_size]))
+        self._content_buffer.truncate()
+        self._content_buffer.seek(0)
+        self._file_info()
+        return self
+
     @requires_numpy()
     def from_np_array(self, np_array: np.array):
         """
         Convert a numpy array to a file which is saved as bytes b"\x93NUMPY" into the buffer.
         """
-        self._reset_buffer()
-        np.save(self._content_buffer, np_array)
+        # a fresh BytesIO skips the truncate(0) of the old buffer, which frees and
+        # reallocates its internal block; the previous buffer is dropped wholesale instead
+        self._invalidate_info()
+        self.path = None  # content no longer comes from a file on disk
+        buffer = io.BytesIO()
+        np.save(buffer, np_array)
+        buffer.seek(0)
+        self._content_buffer = buffer
         return self
 
     def from_dict(self, file_result_json: dict):
@@ -174,9 +286,8 @@ class MediaFile:
         Download a file from an url.
         """
         # code inspired by: https://github.com/runpod/runpod-python/blob/main/runpod/serverless/utils/rp_download.py
-        import requests
         HEADERS = {"User-Agent": "runpod-python/0.0.0 (https://runpod.io; support@runpod.io)"}
-        with requests.get(url, headers=HEADERS, stream=True, timeout=5) as response:
+        with _get_requests_session().get(url, headers=HEADERS, stream=True, timeout=5) as response:
             response.raise_for_status()
 
             # get orig file name or create new
@@ -195,25 +306,38 @@ class MediaFile:
 
             # DOWNLOAD FILE IN Chunks
             file_size = int(response.headers.get('Content-Length', 0))
-            # calculate chunk_size
-            if file_size <= 1024 * 1024:  # 1 MB
-                chunk_size = 1024  # 1 KB
-            elif file_size <= 1024 * 1024 * 1024:  # 1 GB
-                chunk_size = 1024 * 1024  # 1 MB
+            if file_size > 0 and response.headers.get('Content-Encoding') is None:
+                # known size and no transfer compression: preallocate and read straight into the buffer
+                buf = bytearray(file_size)
+                view = memoryview(buf)
+                offset = 0
+                while offset < file_size:
+                    n = response.raw.readinto(view[offset: offset + 1024 * 1024])
+                    if not n:
+                        break
+                    offset += n
+                file = io.BytesIO(view[:offset] if offset < file_size else buf)
             else:
-                chunk_size = 1024 * 1024 * 10  # 10 MB
-
-            # write the content in chunks to the file
-            file = io.BytesIO()
-            for chunk in response.iter_content(chunk_size=chunk_size):
-                if chunk:  # filter out keep-alive chunks
-                    file.write(chunk)
+                # chunked/unknown length: stream in large chunks to keep the python loop short
+                file = io.BytesIO()
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    if chunk:  # filter out keep-alive chunks
+                        file.write(chunk)
             file.name = original_file_name
             self.file_name = original_file_name
 
+            # the response headers already tell us the content type; no need to guess it again
+            response_content_type = response.headers.get('Content-Type')
+            if response_content_type:
+                self.content_type = response_content_type.split(';')[0].strip()
+                self._skip_file_info = True
+
             # self.url = url
 
-            return self.from_bytesio_or_handle(file, copy=False)
+            try:
+                return self.from_bytesio_or_handle(file, copy=False)
+            finally:
+                self._skip_file_info = False
 
     @requires_numpy()
     def to_np_array(self, shape=None, dtype=np.uint8):
@@ -226,6 +350,13 @@ class MediaFile:
         bytes = self.to_bytes()
         # check if was saved with np.save so bytes contains NUMPY
         if bytes.startswith(b"\x93NUMPY"):
+            # the mmap shortcut is only valid when the buffer content actually came from
+            # self.path; loaders that replace the content clear the path, and the size
+            # compare guards against a path that went stale some other way
+            if self.path is not None and os.path.isfile(self.path) \
+                    and os.path.getsize(self.path) == len(bytes):
+                # memory-map arrays that live on disk: O(1) load, pages fault in on access
+                return np.load(self.path, mmap_mode='r', allow_pickle=False)
             self._content_buffer.seek(0)
             return np.load(self._content_buffer, allow_pickle=False)
 
@@ -239,24 +370,49 @@ class MediaFile:
         return self.read()
 
     def read(self) -> bytes:
+        # one C-level call; the former seek/read/seek round trip did the same with three
+        if isinstance(self._content_buffer, io.BytesIO):
+            return self._content_buffer.getvalue()
         self._content_buffer.seek(0)
         res = self._content_buffer.read()
         self._content_buffer.seek(0)
         return res
 
+    def _read_view(self) -> memoryview:
+        """
+        Zero-copy read-only view on the content. Used internally where the data is consumed
+        immediately (save, sending); the buffer must not be written to while the view is alive.
+        """
+        self._content_buffer.seek(0)
+        try:
+            return self._content_buffer.getbuffer()
+        except AttributeError:
+            # mmap-backed content (from_file(..., use_mmap=True)) supports the buffer protocol
+            return memoryview(self._content_buffer)
+
     def to_bytes_io(self) -> io.BytesIO:
         self._content_buffer.seek(0)
         return self._content_buffer
 
     def to_base64(self):
-        return base64.b64encode(self.to_bytes()).decode('ascii')
+        # _read_view() is a zero-copy view on the buffer; saves a full copy compared to to_bytes()
+        return base64.b64encode(self._read_view()).decode('ascii')
 
     def to_httpx_send_able_tuple(self):
-        return self.file_name, self.read(), self.content_type
+        return self.file_name, self._read_view(), self.content_type
 
     def _reset_buffer(self):
-        self._content_buffer.seek(0)
-        self._content_buffer.truncate(0)
+        self._invalidate_info()
+        if isinstance(self._content_buffer, io.BytesIO):
+            self._content_buffer.seek(0)
+            self._content_buffer.truncate(0)
+        else:
+            # mmap- or handle-backed content is read-only; start over with a private buffer
+            self._content_buffer = io.BytesIO()
+
+    def _invalidate_info(self):
+        """Called whenever the content changes. Subclasses caching probed metadata reset it here."""
+        pass
 
     def save(self, path: str = None):
         """
@@ -284,8 +440,12 @@ class MediaFile:
         # if os.path.splitext(path)[1] == "":
         #    path += ".mp4"
 
+        # stream in 1 MiB chunks; a single write of the whole payload would need the full
+        # file as one bytes object and can hit kernel write limits for very large files
         with open(path, 'wb') as file:
-            file.write(self.read())
+            self._content_buffer.seek(0)
+            shutil.copyfileobj(self._content_buffer, file, length=1 << 20)
+            self._content_buffer.seek(0)
 
     def _file_info(self):
         """
@@ -302,9 +462,14 @@ class MediaFile:
         # from starlette_upload_file -> from_buffered_reader(spooled_temporary) -> info from the spooled_temporary
         # from base64 -> from-bytes -> tempfile
         # from url -> from bytesio
+        if self._skip_file_info:
+            # metadata was provided by the caller; subclasses still run their own probing after this
+            return
+
         if self.path is not None:
             self.file_name = os.path.basename(self.path)
-            self.content_type = mimetypes.guess_type(self.file_name)[0] or "application/octet-stream"
+            ext = os.path.splitext(self.file_name)[1].lstrip('.').lower()
+            self.content_type = _guess_content_type(ext)
         elif hasattr(self._content_buffer, "name"):
             self.file_name = os.path.basename(self._content_buffer.name)
 
@@ -315,7 +480,7 @@ class MediaFile:
         """
         :param unit:
         """
-        size_in_ = self._content_buffer.getbuffer().nbytes
+        size_in_ = self._read_view().nbytes
         if unit == "bytes":
             return size_in_
         elif unit == "kb":
@@ -332,6 +497,19 @@ class MediaFile:
     def __array__(self):
         return self.to_np_array()
 
+    @property
+    def __array_interface__(self):
+        """
+        Lets np.asarray(media_file) wrap the raw content zero-copy as a flat uint8 array.
+        Subclasses whose to_np_array decodes the content (image, audio) raise AttributeError
+        so numpy falls back to __array__.
+        """
+        buf = self._read_view()
+        if bytes(buf[:6]) == b"\x93NUMPY":
+            # stored ndarrays need np.load; fall back to __array__
+            raise AttributeError("__array_interface__")
+        return {'shape': (len(buf),), 'typestr': '|u1', 'data': buf, 'version': 3}
+
     def to_json(self):
         """
         Returns the file as a json serializable dictionary.
@@ -344,34 +522,49 @@ class MediaFile:
         }
 
     @staticmethod
-    def _decode_base_64_if_is(data: Union[bytes, str]):
+    def _decode_base_64_if_is(data: Union[bytes, str]) -> Union[bytes, None]:
         """
-        Checks if a string is base64. If it is, it returns the base64 string as bytes; else returns None.
+        Checks if a string looks like base64. Only validates the structure (alphabet, padding,
+        length); the actual decode in from_base64 catches anything that slips through.
+        Returns the ascii-encoded bytes so the decoder can reuse them, or None when not base64.
         """
         if isinstance(data, str):
-            data = data.encode()
-
-        try:
-            # Decode the data
-            decoded = base64.b64decode(data, validate=True)
-            # Re-encode the decoded data
-            back_encoded = base64.b64encode(decoded)
-            # Compare with the original encoded data
-            if back_encoded == data:
-                return decoded
-        except Exception:
-            pass
+            try:
+                data = data.encode('ascii')
+            except UnicodeEncodeError:
+                return None
 
+        if len(data) % 4 == 0 and _BASE64_RE.match(data) is not None:
+            return data
         return None
 
     @staticmethod
     def _is_valid_file_path(path: str):
+        # cheap guards before the stat syscall: base64 blobs can be megabytes long and
+        # os.path.isfile would still encode them (or raise "File name too long").
+        if not isinstance(path, (str, os.PathLike)):
+            return False
         try:
-            is_file = os.path.isfile(path)
-            return is_file
-        except:
+            path = os.fsdecode(path)  # PathLike objects don't support len()/in directly
+        except (TypeError, ValueError):
+            return False
+        if len(path) > 4096 or '\n' in path or '\x00' in path:
+            return False
+        try:
+            return os.path.isfile(path)
+        except (OSError, TypeError, ValueError):
             return False
 
     @staticmethod
     def _is_url(url: str):
+        # urls we download all start with http(s); skip urlparse for everything else.
+        # scheme matching is case-insensitive (HTTP://... is a valid url)
+        if url[:4].lower() != 'http':
+            return False
         return urlparse(url).scheme in ['http', 'https']
+
+
+try:
+    MediaFile._FROM_ANY_DISPATCH[np.ndarray] = 'from_np_array'
+except NameError:  # numpy not installed
+    pass
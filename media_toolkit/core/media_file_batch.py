@@ -0,0 +1,57 @@
+from typing import Union
+
+from media_toolkit.core.media_file import MediaFile
+
+
+class MediaFileBatch:
+    """
+    Structure-of-arrays container for many small payloads (e.g. the frames of a video that
+    are sent as one HTTP batch). Instead of one BytesIO + bytes + metadata strings per file,
+    all payloads live back to back in a single bytearray pool with offset/size bookkeeping --
+    O(1) heap objects instead of ~5 per file, and one contiguous block for bulk uploads.
+    """
+    def __init__(self):
+        self.pool = bytearray()
+        self.offsets = []
+        self.sizes = []
+        self.file_names = []
+        self.content_types = []
+
+    def append(self, payload: Union[bytes, bytearray, memoryview, MediaFile],
+               file_name: str = None, content_type: str = None):
+        """
+        Appends one payload to the pool. Accepts raw encoded bytes or a MediaFile, whose
+        name and content type are used unless overridden.
+        """
+        if isinstance(payload, MediaFile):
+            file_name = file_name or payload.file_name
+            content_type = content_type or payload.content_type
+            payload = payload._read_view()
+
+        self.offsets.append(len(self.pool))
+        self.sizes.append(len(payload))
+        self.file_names.append(file_name or f"file_{len(self.offsets) - 1}")
+        self.content_types.append(content_type or "application/octet-stream")
+        self.pool.extend(payload)
+        return self
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __getitem__(self, index: int) -> memoryview:
+        # zero-copy view into the pool; valid until the next append
+        off, size = self.offsets[index], self.sizes[index]
+        return memoryview(self.pool)[off:off + size]
+
+    def to_httpx_tuples(self):
+        """
+        Yields (file_name, payload_view, content_type) tuples as accepted by httpx/requests
+        multipart uploads. The payloads are memoryviews into the shared pool -- no copies.
+        """
+        pool_view = memoryview(self.pool)
+        for name, off, size, ct in zip(self.file_names, self.offsets, self.sizes, self.content_types):
+            yield name, pool_view[off:off + size], ct
+
+    def to_bytes(self) -> bytes:
+        """The whole pool as one contiguous bytes object, e.g. for a single bulk upload."""
+        return bytes(self.pool)
@@ -1,12 +1,17 @@
-import glob
 import os
+import subprocess
 import tempfile
+from contextlib import contextmanager
 from io import BytesIO
 from typing import List, Union
 
 from media_toolkit.core.video.video_utils import (add_audio_to_video_file, audio_array_to_audio_file,
-                                                  video_from_image_generator, get_audio_sample_rate_from_file)
-from media_toolkit.utils.generator_wrapper import SimpleGeneratorWrapper
+                                                  video_from_image_generator, get_audio_sample_rate_from_file,
+                                                  get_audio_sample_rate_from_bytes, get_audio_codec_from_file,
+                                                  mux_video_with_audio_from_frames, parallel_video_from_image_files,
+                                                  FFmpegFrameReader, pick_hwaccel)
+from media_toolkit.utils.ffprobe import ffprobe_json
+from media_toolkit.utils.generator_wrapper import SimpleGeneratorWrapper, prefetch_generator
 from media_toolkit.utils.dependency_requirements import requires
 from media_toolkit.core.media_file import MediaFile
 
@@ -28,6 +33,102 @@ except ImportError:
     pass
 
 
+# export types whose audio track can be stream-copied (no transcode) when the container
+# already holds a matching codec: export_type -> (accepted codec names, ffmpeg muxer)
+_AUDIO_COPY_TARGETS = {
+    "mp3": ({"mp3"}, "mp3"),
+    "m4a": ({"aac"}, "ipod"),
+    "aac": ({"aac"}, "adts"),
+    "ogg": ({"vorbis", "opus"}, "ogg"),
+    "wav": ({"pcm_s16le"}, "wav"),
+}
+
+# precomputed at import so _to_temp_file doesn't re-parse the content type on every call
+_SUFFIX_MAP = {
+    "video/mp4": ".mp4",
+    "video/webm": ".webm",
+    "video/quicktime": ".mov",
+    "video/x-msvideo": ".avi",
+    "video/x-matroska": ".mkv",
+    "video/mpeg": ".mpeg",
+}
+
+
+class FramePool:
+    """
+    Recycles decoded-frame buffers between iterations of to_video_stream. Without it every
+    yielded frame is a fresh allocation that the consumer discards, which churns malloc and
+    the GC at video rates. Consumers hand frames back with release() once they are done;
+    get() then reuses the buffer for a later frame instead of allocating a new one.
+    """
+
+    def __init__(self, maxsize: int = 8):
+        self._maxsize = maxsize  # bounds the RAM held by idle buffers
+        self._buffers = []
+
+    def get(self, height: int, width: int, dtype=None):
+        """Returns a reusable (height, width, 3) buffer, allocating only when the pool is empty."""
+        dtype = np.uint8 if dtype is None else dtype
+        for i, buf in enumerate(self._buffers):
+            if buf.shape == (height, width, 3) and buf.dtype == dtype:
+                return self._buffers.pop(i)
+        return np.empty((height, width, 3), dtype=dtype)
+
+    def release(self, frame):
+        """Returns a frame to the pool. Frames beyond maxsize are dropped for the GC."""
+        if isinstance(frame, np.ndarray) and frame.ndim == 3 and len(self._buffers) < self._maxsize:
+            self._buffers.append(frame)
+
+
+class _AudioAccumulator:
+    """
+    Collects the per-frame audio chunks of a video stream. When the number of frames is known and
+    the chunks are uniform, they are written into one pre-sized flat int16 buffer instead of a
+    python list of arrays, which avoids the final concatenation pass. Falls back to a list for
+    unknown lengths or varying chunk sizes.
+    """
+
+    def __init__(self, n_frames: int = None):
+        self._n_frames = n_frames
+        self._buf = None
+        self._samples_per_frame = None
+        self._count = 0
+        self._chunks = []  # fallback storage
+
+    def append(self, chunk):
+        chunk = np.asarray(chunk)
+        if (self._buf is None and not self._chunks and self._n_frames
+                and chunk.ndim == 1 and len(chunk) > 0):
+            self._samples_per_frame = len(chunk)
+            # match the incoming dtype: an int16 buffer would truncate the float32/int8
+            # chunks that to_video_stream(audio_dtype=...) yields to silence
+            self._buf = np.zeros(self._n_frames * self._samples_per_frame, dtype=chunk.dtype)
+
+        if (self._buf is not None and chunk.ndim == 1
+                and len(chunk) == self._samples_per_frame and self._count < self._n_frames):
+            start = self._count * self._samples_per_frame
+            self._buf[start:start + self._samples_per_frame] = chunk
+            self._count += 1
+            return
+
+        # non-uniform chunk or overflow: spill the buffer and continue with the list fallback
+        if self._buf is not None:
+            self._chunks.extend(self._buf[:self._count * self._samples_per_frame]
+                                .reshape(-1, self._samples_per_frame))
+            self._buf = None
+            self._count = 0
+        self._chunks.append(chunk)
+
+    def __len__(self):
+        return self._count + len(self._chunks)
+
+    def to_array(self):
+        """Returns the chunks as (n_frames, samples_per_frame) -- a zero-copy view when pre-sized."""
+        if self._buf is not None:
+            return self._buf[:self._count * self._samples_per_frame].reshape(-1, self._samples_per_frame)
+        return self._chunks
+
+
 class VideoFile(MediaFile):
     """
     A class to represent a video file.
@@ -43,20 +144,46 @@ class VideoFile(MediaFile):
         self.shape = None
         self.duration = None
         self.audio_sample_rate = None
+        self._probed = False  # whether _file_info already ran for the current content
+        self._temp_source = None  # (content key, path) of the cached temp file for _as_source
 
-    def from_files(self, image_files: Union[List[str], list], frame_rate: int = 30, audio_file=None):
+    def from_files(self, image_files: Union[List[str], list], frame_rate: int = 30, audio_file=None,
+                   encoder: str = 'auto', parallel: bool = False):
         """
         Creates a video based of a list of image files and an audio_file file.
         :param image_files: A list of image files to convert to a video. Either paths or numpy arrays.
         :param frame_rate: The frame rate of the video.
         :param audio_file: The audio_file file to add to the video, as path, bytes or AudioSegment.
+        :param encoder: The H.264 encoder. 'auto' uses the hardware encoder if one works on this machine.
+        :param parallel: Encode long path lists as segments in a process pool (see
+            parallel_video_from_image_files). Opt-in: on spawn platforms (Windows/macOS) the
+            caller must be importable under the __main__ guard for worker processes to start.
         """
         # Check if there are images in the list
         if not image_files:
             raise ValueError("The list of image files is empty.")
 
-        # Create a temporary file to store the video
-        temp_vid_file_path = video_from_image_generator(image_files, frame_rate=frame_rate, save_path=None)
+        # one ffmpeg pass encodes the frames and muxes the audio_file; the old
+        # encode-then-remux sequence wrote the video to disk twice
+        if audio_file is not None and isinstance(audio_file, str) and os.path.isfile(audio_file):
+            combined = mux_video_with_audio_from_frames(
+                image_files, audio_file, frame_rate=frame_rate, encoder=encoder
+            )
+            self.from_file(combined)
+            os.remove(combined)
+            return self
+
+        # Create a temporary file to store the video. With parallel=True, long lists of image
+        # paths without audio are encoded as parallel segments and stream-copy concatenated.
+        if parallel and audio_file is None and isinstance(image_files, list) and image_files \
+                and isinstance(image_files[0], str):
+            temp_vid_file_path = parallel_video_from_image_files(
+                image_files, frame_rate=frame_rate, save_path=None, encoder=encoder
+            )
+        else:
+            temp_vid_file_path = video_from_image_generator(
+                image_files, frame_rate=frame_rate, save_path=None, encoder=encoder
+            )
         # Merge video and audio_file using pydub
         if audio_file is not None:
             combined = add_audio_to_video_file(video_file=temp_vid_file_path, audio_file=audio_file)
@@ -72,34 +199,34 @@ class VideoFile(MediaFile):
 
         return self
 
-    def from_image_files(self, image_files: List[str], frame_rate: int = 30):
+    def from_image_files(self, image_files: List[str], frame_rate: int = 30, encoder: str = 'auto'):
         """
         Converts a list of image files into a video file.
         """
-        return self.from_files(image_files, frame_rate, audio_file=None)
+        return self.from_files(image_files, frame_rate, audio_file=None, encoder=encoder)
 
-    def from_dir(self, dir_path: str, audio: Union[str, list] = None, frame_rate: int = 30):
+    def from_dir(self, dir_path: str, audio: Union[str, list] = None, frame_rate: int = 30,
+                 encoder: str = 'auto'):
         """
         Converts all images in a directory into a video file.
         """
-        image_types = ["*.png", "*.jpg", "*.jpeg"]
-        image_files = []
-        for image_type in image_types:
-            image_files.extend(glob.glob(os.path.join(dir_path, image_type)))
-        # sort by date to make sure the order is correct
-        image_files.sort(key=lambda x: os.path.getmtime(x))
-
-        # if audio_file is none, take the first audio_file file in the directory
-        if audio is None:
-            audio_types = ["*.wav", "*.mp3"]
-            for audio_type in audio_types:
-                audio = glob.glob(os.path.join(dir_path, audio_type))
-                if len(audio) > 0:
-                    audio = audio[0]
-                else:
-                    audio = None
-
-        return self.from_files(image_files=image_files, frame_rate=frame_rate, audio_file=audio)
+        # one scandir pass picks up images and audio_file together; the repeated glob + getmtime
+        # approach cost several stat() syscalls per file
+        image_entries = []
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                name = entry.name.lower()
+                if name.endswith((".png", ".jpg", ".jpeg")):
+                    image_entries.append(entry)
+                elif audio is None and name.endswith((".wav", ".mp3")):
+                    # if audio_file is none, take the first audio_file file in the directory
+                    audio = entry.path
+
+        # sort by date to make sure the order is correct; DirEntry caches the stat result
+        image_entries.sort(key=lambda e: e.stat().st_mtime)
+        image_files = [entry.path for entry in image_entries]
+
+        return self.from_files(image_files=image_files, frame_rate=frame_rate, audio_file=audio, encoder=encoder)
 
     def add_audio(self, audio_file: Union[str, list], sample_rate: int = 44100):
         """
@@ -116,50 +243,81 @@ class VideoFile(MediaFile):
             if os.path.isfile(audio_file):
                 self.audio_sample_rate = get_audio_sample_rate_from_file(audio_file)
             else:
-                self.audio_sample_rate = get_audio_sample_rate_from_file(self._to_temp_file())
+                # probe the in-memory buffer directly; no temp-file write + read
+                self.audio_sample_rate = get_audio_sample_rate_from_bytes(self._read_view())
 
         if isinstance(audio_file, list) or isinstance(audio_file, np.ndarray):
+            if isinstance(audio_file, list) and audio_file and np.ndim(audio_file[0]) == 1:
+                # one vectorized stack instead of np.array growing the copy chunk by chunk
+                audio_file = np.vstack(audio_file)
             audio_file = audio_array_to_audio_file(audio_file, sample_rate=sample_rate)
 
-        tmp = self._to_temp_file()
-        combined = add_audio_to_video_file(tmp, audio_file)
+        with self._as_source() as tmp:
+            combined = add_audio_to_video_file(tmp, audio_file)
         self.from_file(combined)
-        os.remove(tmp)
         os.remove(combined)
         return self
 
-    def read(self):
-        self._content_buffer.seek(0)
-        return self._content_buffer.getvalue()
-
     def _to_temp_file(self):
         # get suffix
-        if self.content_type is None:
-            raise ValueError("The content type of the video file is not set.")
-        if "/" not in self.content_type:
-            raise ValueError("The content type of the video file is not valid. Read a video file first.")
-        suffix = self.content_type.split("/")[1]
-        if suffix == 'octet-stream':
-            raise ValueError("The content type of the video file is not valid. Read a video file first.")
-
-        with tempfile.NamedTemporaryFile(delete=False, suffix=f".{suffix}") as temp_video_file:
-            temp_video_file.write(self.read())
+        suffix = _SUFFIX_MAP.get(self.content_type)
+        if suffix is None:
+            # less common containers fall back to parsing the content type
+            if self.content_type is None:
+                raise ValueError("The content type of the video file is not set.")
+            if "/" not in self.content_type or self.content_type == "application/octet-stream":
+                raise ValueError("The content type of the video file is not valid. Read a video file first.")
+            suffix = f".{self.content_type.split('/')[1]}"
+
+        # prefer a RAM-backed tmpfs so the "file" never touches the disk
+        tmp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix, dir=tmp_dir) as temp_video_file:
+            # zero-copy view straight into os.write; getvalue() would copy the whole video first
+            temp_video_file.write(self._read_view())
             temp_video_file_path = temp_video_file.name
 
         return temp_video_file_path
 
+    @contextmanager
+    def _as_source(self):
+        """
+        Yields a path readers (cv2, ffmpeg, pydub) can open. The buffer is written out once per
+        content: back-to-back calls (e.g. to_video_stream followed by add_audio) reuse the cached
+        temp file instead of writing it again. The cache is dropped when the content changes.
+        """
+        key = (id(self._content_buffer), len(self._read_view()))
+        if (self._temp_source is not None and self._temp_source[0] == key
+                and os.path.exists(self._temp_source[1])):
+            yield self._temp_source[1]
+            return
+        self._drop_temp_source()
+        temp_path = self._to_temp_file()
+        self._temp_source = (key, temp_path)
+        yield temp_path
+
+    def _drop_temp_source(self):
+        if self._temp_source is not None:
+            try:
+                os.remove(self._temp_source[1])
+            except OSError:
+                pass
+            self._temp_source = None
+
     @requires('vidgear', 'numpy', 'pydub')
-    def from_video_stream(self, video_audio_stream, frame_rate: int = 30, audio_sample_rate: int = 44100):
+    def from_video_stream(self, video_audio_stream, frame_rate: int = 30, audio_sample_rate: int = 44100,
+                          encoder: str = 'auto'):
         """
         Given a generator that yields video frames and audio_file data as numpy arrays, this creates a video.
         The generator is expected to be in the form of: VideoFile().to_video_stream()
             or a generator that yields images as numpy arrays like VideoFile().to_image_stream().
+        :param encoder: The H.264 encoder. 'auto' uses the hardware encoder if one works on this machine.
         """
         # Reset and pre-settings
         self._reset_buffer()
 
-        # new generator, to extract audio_file
-        audio_frames = []
+        # audio_file chunks go into a pre-sized buffer when the stream length is known
+        stream_len = len(video_audio_stream) if hasattr(video_audio_stream, '__len__') else None
+        audio_frames = _AudioAccumulator(n_frames=stream_len)
 
         def _frame_gen():
             for frame in video_audio_stream:
@@ -174,16 +332,18 @@ class VideoFile(MediaFile):
 
         # allows tqdm to work with the generator
         video_gen_wrapper = _frame_gen()
-        if hasattr(video_audio_stream, '__len__'):
-            video_gen_wrapper = SimpleGeneratorWrapper(video_gen_wrapper, length=len(video_audio_stream))
+        if stream_len is not None:
+            video_gen_wrapper = SimpleGeneratorWrapper(video_gen_wrapper, length=stream_len)
 
         # Create video
-        temp_video_file_path = video_from_image_generator(video_gen_wrapper, frame_rate=frame_rate, save_path=None)
+        temp_video_file_path = video_from_image_generator(
+            video_gen_wrapper, frame_rate=frame_rate, save_path=None, encoder=encoder
+        )
 
         # Add audio_file
         if len(audio_frames) > 0:
             try:
-                temp_audio_file = audio_array_to_audio_file(audio_frames, sample_rate=audio_sample_rate)
+                temp_audio_file = audio_array_to_audio_file(audio_frames.to_array(), sample_rate=audio_sample_rate)
                 combined = add_audio_to_video_file(temp_video_file_path, temp_audio_file)
                 self.from_file(combined)
                 # cleanup
@@ -199,19 +359,85 @@ class VideoFile(MediaFile):
         os.remove(temp_video_file_path)
         return self
 
-    @requires('cv2', 'pydub')
+    def _invalidate_info(self):
+        self._probed = False
+        self._drop_temp_source()
+
+    def __del__(self):
+        if getattr(self, "_temp_source", None) is not None:
+            self._drop_temp_source()
+
+    @requires('pydub')
     def _file_info(self):
+        # probing spawns ffprobe (and possibly cv2) on a temp file; do it once per content
+        if self._probed:
+            return
         super()._file_info()  # sets: file_name, content_type.
 
         # care for the case that it was loaded from_bytes what usually does not provide any filename / info.
         # In this case we need to write the data first to file and then retrieve the info again.
-        path = self.path
-        is_temp_file = False
-        if path is None or not os.path.exists(path):
+        if self.path is not None and os.path.exists(self.path):
+            self._probe_file_info(self.path)
+        else:
             self._content_buffer.seek(0)
-            path = self._to_temp_file()
-            is_temp_file = True
+            with self._as_source() as path:
+                self._probe_file_info(path)
+        self._probed = True
+
+    @staticmethod
+    def _parse_rate(val):
+        # frame rates come as fractions like "30000/1001"
+        if not val or val in ('N/A', '0/0'):
+            return None
+        if "/" in val:
+            num, den = val.split("/")[:2]
+            return float(num) / float(den) if float(den) != 0 else None
+        return float(val)
+
+    def _probe_file_info(self, path: str):
+        # one ffprobe call, parsed as JSON into native types -- straight-line assignments,
+        # no per-field string splitting. pydub's text parsing remains as fallback.
+        probe = ffprobe_json(path)
+        if probe is not None and self._apply_probe(probe):
+            return
+        self._probe_file_info_mediainfo(path)
+
+    def _apply_probe(self, probe: dict) -> bool:
+        streams = probe.get("streams", [])
+        video = next((s for s in streams if s.get("codec_type") == "video"), None)
+        audio = next((s for s in streams if s.get("codec_type") == "audio"), None) or {}
+        fmt = probe.get("format", {})
+        if video is None and not fmt:
+            return False
+        video = video or {}
+
+        def _num(val):
+            try:
+                return float(val)
+            except (TypeError, ValueError):
+                return None
+
+        self.width = _num(video.get("width"))
+        self.height = _num(video.get("height"))
+        self.shape = (self.width, self.height)
+        self.duration = _num(video.get("duration")) or _num(fmt.get("duration"))
+        self.frame_count = _num(video.get("nb_frames"))
+        self.audio_sample_rate = _num(audio.get("sample_rate")) or 44100
+
+        # r_frame_rate is the reliable one; avg_frame_rate can be flaky for variable frame rates
+        self.frame_rate = self._parse_rate(video.get("r_frame_rate")) \
+            or self._parse_rate(video.get("avg_frame_rate"))
+        if (self.frame_count is None or self.frame_count == 1) \
+                and self.duration is not None and self.frame_rate:
+            self.frame_count = round(self.duration * self.frame_rate)
+
+        if "format_name" in fmt:
+            self.content_type = f"video/{fmt['format_name'].split(',')[0]}"
+        else:
+            self.content_type = "video/mp4"  # overwrite default "application/octet-stream"
+        return True
 
+    def _probe_file_info_mediainfo(self, path: str):
         # get video info
         info = mediainfo(path)
 
@@ -225,6 +451,16 @@ class VideoFile(MediaFile):
                 return float(val)
             return default_val
 
+        def info_to_rate(key: str):
+            # frame rates come as fractions like "30000/1001"
+            val = info.get(key)
+            if not val or val in ('N/A', '0/0'):
+                return None
+            if "/" in val:
+                num, den = val.split("/")[:2]
+                return float(num) / float(den) if float(den) != 0 else None
+            return float(val)
+
         self.frame_count = info_to_number('nb_frames')
         self.duration = info_to_number('duration')
         self.width = info_to_number('width')
@@ -232,25 +468,12 @@ class VideoFile(MediaFile):
         self.shape = (self.width, self.height)
         self.audio_sample_rate = info_to_number('sample_rate', 44100)
 
-        self.frame_rate = info_to_number('avg_frame_rate', None)
-        # need to determine the frame rate with cv2 because pydub calculation gives some weird results..
-        if self.frame_rate is None or self.frame_count is None or self.frame_count == 1:
-            cap = cv2.VideoCapture(path)
-            self.frame_rate = cap.get(cv2.CAP_PROP_FPS)
-            self.frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-            cap.release()
-
-        # if self.width is None or self.height is None:
-        #    # try to get it with cv2
-        #    cap = cv2.VideoCapture(path)
-        #    self.width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-        #    self.height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-        #    self.shape = (self.width, self.height)
-        #    self.frame_rate = cap.get(cv2.CAP_PROP_FPS)
-        #    cap.release()
-        # else:
-        #    if self.frame_count is not None and self.duration is not None:
-        #        self.frame_rate = int(self.frame_count / self.duration)
+        # r_frame_rate is the reliable one; avg_frame_rate can be flaky for variable frame rates.
+        # no cv2.VideoCapture fallback anymore -- opening it initializes a whole decoder just for metadata.
+        self.frame_rate = info_to_rate('r_frame_rate') or info_to_rate('avg_frame_rate')
+        if (self.frame_count is None or self.frame_count == 1) \
+                and self.duration is not None and self.frame_rate:
+            self.frame_count = round(self.duration * self.frame_rate)
 
         if 'format_name' in info:
             format_name = info['format_name'].split(",")[0]
@@ -258,112 +481,297 @@ class VideoFile(MediaFile):
         else:
             self.content_type = "video/mp4"  # overwrite default "application/octet-stream"
 
-        # if is tempfile remove it
-        if is_temp_file:
-            os.remove(path)
-
     @requires('vidgear')
     def to_image_stream(self):
         return self.to_video_stream(include_audio=False)
 
+    @requires('numpy')
+    def to_image_batch_stream(self, batch_size: int = 32, **stream_kwargs):
+        """
+        Like to_image_stream, but yields contiguous (n, height, width, 3) uint8 arrays of up
+        to batch_size frames instead of one ndarray per frame. Batched consumers (model
+        inference, bulk encode) index into one allocation and amortize the per-frame
+        generator round trip. stream_kwargs are passed through to to_video_stream
+        (step, start, stop, prefetch).
+        """
+        def gen():
+            batch = None
+            n = 0
+            for frame in self.to_video_stream(include_audio=False, **stream_kwargs):
+                if batch is None:
+                    batch = np.empty((batch_size,) + frame.shape, dtype=np.uint8)
+                batch[n] = frame
+                n += 1
+                if n == batch_size:
+                    yield batch
+                    batch, n = None, 0
+            if n:
+                yield batch[:n]
+
+        return gen()
+
     @requires('pydub', 'vidgear')
-    def to_video_stream(self, include_audio=True):
+    def to_video_stream(self, include_audio=True, step: int = 1, start: int = 0, stop: int = None,
+                        prefetch: int = 64, frame_pool: FramePool = None, audio_dtype: str = 'int16',
+                        image_format: str = 'bgr24'):
         """
         Yields video frames and audio_file data as numpy arrays.
         :param include_audio: if the audio_file is included in the video stream. If not it will only yield the video frames.
+        :param step: yield only every step-th frame. Skipped frames are grabbed but not decoded,
+            so step=15 cuts the decode cost roughly 15x.
+        :param start: index of the first frame to yield.
+        :param stop: index at which to stop reading (exclusive). None reads to the end.
+        :param prefetch: Number of frames a background thread decodes ahead of the consumer, so decoding
+            overlaps with the consumer's work. 0 disables it. Note 64 frames of 1080p are ~400 MB.
+        :param frame_pool: Optional FramePool. Frames are decoded into recycled buffers from the pool;
+            call frame_pool.release(frame) when done with a frame to avoid one allocation per frame.
+        :param audio_dtype: dtype of the yielded audio chunks: 'int16' (native), 'int8' (halves the
+            memory traffic) or 'float32' (scaled to [-1, 1)). Converted once for the whole track.
+        :param image_format: 'bgr24' (default) yields (height, width, 3) BGR frames. 'yuv420p'
+            yields planar I420 frames of shape (height * 3 // 2, width) -- half the bytes per
+            frame and, for consumers that re-encode (mux_video_with_audio_from_frames with
+            input_pix_fmt='yuv420p'), no BGR round trip at all.
         :return:
         """
         self._content_buffer.seek(0)
-        # because CamGear does not support reading from a BytesIO buffer, we need to save the buffer to a temporary file
-        temp_video_file_path = self._to_temp_file()
-        stream = VideoGear(source=temp_video_file_path).start()
+        # because CamGear does not support reading from a BytesIO buffer, we need to save the buffer to a
+        # (RAM-backed) temporary file
+        with self._as_source() as temp_video_file_path:
+            if step > 1 or start > 0 or stop is not None:
+                gen = self._subsampled_stream_from_path(
+                    temp_video_file_path, include_audio=include_audio, step=step, start=start, stop=stop,
+                    frame_pool=frame_pool, audio_dtype=audio_dtype, image_format=image_format
+                )
+            else:
+                gen = self._video_stream_from_path(
+                    temp_video_file_path, include_audio=include_audio, frame_pool=frame_pool,
+                    audio_dtype=audio_dtype, image_format=image_format
+                )
+            if prefetch and prefetch > 0:
+                gen = prefetch_generator(gen, buffer_size=prefetch)
+            yield from gen
+
+    @requires('cv2', 'pydub')
+    def _subsampled_stream_from_path(self, path: str, include_audio: bool, step: int, start: int, stop: int,
+                                     frame_pool: FramePool = None, audio_dtype: str = 'int16',
+                                     image_format: str = 'bgr24'):
+        """
+        Frame-skipping reader: cap.grab() only advances the demuxer, the expensive decode
+        (cap.retrieve()) runs for the yielded frames only.
+        """
+        cap = cv2.VideoCapture(path)
+        framerate = cap.get(cv2.CAP_PROP_FPS) or self.frame_rate or 30
+        pool_shape = None
+        if frame_pool is not None:
+            pool_shape = (int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)), int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)))
 
         if include_audio:
-            # Extract audio_file using pydub
             try:
-                audio = AudioSegment.from_file(temp_video_file_path)
-                # Calculate the audio_file segment duration per frame
-                audio_per_frame_duration = 1000 / stream.framerate  # duration of each video frame in ms
+                samples, samples_per_frame = self._load_audio_samples(path, framerate)
+                samples = self._convert_audio_dtype(samples, audio_dtype)
+                pad_buf = np.zeros(samples_per_frame, dtype=samples.dtype)
+            except:
+                include_audio = False
+                print("Could not extract audio_file from video file. Audio will not be included in the video stream.")
+
+        frame_index = 0
+        try:
+            while True:
+                if stop is not None and frame_index >= stop:
+                    break
+                if not cap.grab():
+                    break
+                if frame_index < start or (frame_index - start) % step != 0:
+                    frame_index += 1
+                    continue
+
+                if pool_shape is not None and pool_shape[0] > 0:
+                    # decode into a recycled buffer instead of a fresh cv2 allocation
+                    ok, frame = cap.retrieve(frame_pool.get(*pool_shape))
+                else:
+                    ok, frame = cap.retrieve()
+                if not ok:
+                    break
+                if image_format == 'yuv420p':
+                    # cv2 always decodes to BGR; one SIMD cvtColor gives the planar layout
+                    frame = cv2.cvtColor(frame, cv2.COLOR_BGR2YUV_I420)
+
+                if not include_audio:
+                    yield frame
+                else:
+                    yield frame, self._slice_frame_audio(samples, samples_per_frame, frame_index, out=pad_buf)
+
+                frame_index += 1
+        finally:
+            cap.release()
+
+    @staticmethod
+    def _load_audio_samples(path: str, framerate: float):
+        """
+        Decodes the audio track once and returns (samples, samples_per_frame): a flat interleaved
+        sample array plus the number of values belonging to one video frame. Slicing numpy views
+        per frame replaces pydub's per-frame AudioSegment copies.
+        """
+        audio = AudioSegment.from_file(path)
+        dtype = {1: np.int8, 2: np.int16, 4: np.int32}.get(audio.sample_width, np.int16)
+        samples = np.frombuffer(audio.raw_data, dtype=dtype)
+        samples_per_frame = int(round(audio.frame_rate / framerate)) * audio.channels
+        return samples, samples_per_frame
+
+    @staticmethod
+    def _convert_audio_dtype(samples, audio_dtype):
+        """
+        Packs the whole decoded track in one vectorized pass -- not per frame. 'int8' halves the
+        bytes shipped with every frame (enough for VAD/feature consumers), 'float32' scales to
+        [-1, 1) for ML pipelines. 'int16' (the pydub native width) passes through untouched.
+        """
+        if audio_dtype in (None, 'int16') or samples.dtype == np.dtype(audio_dtype):
+            return samples
+        if audio_dtype == 'int8':
+            return np.right_shift(samples, 8 * (samples.dtype.itemsize - 1)).astype(np.int8)
+        if audio_dtype == 'float32':
+            return (samples / float(np.iinfo(samples.dtype).max + 1)).astype(np.float32)
+        raise ValueError(f"Unsupported audio_dtype {audio_dtype}. Use 'int16', 'int8' or 'float32'.")
+
+    @staticmethod
+    def _slice_frame_audio(samples, samples_per_frame: int, frame_index: int, out=None):
+        """
+        Zero-copy view on the samples of one video frame. A too-short tail is written into the
+        preallocated out buffer (silence padded) instead of allocating via np.pad per frame.
+        """
+        audio_data = samples[frame_index * samples_per_frame: (frame_index + 1) * samples_per_frame]
+        if len(audio_data) < samples_per_frame:
+            if out is None:
+                out = np.zeros(samples_per_frame, dtype=samples.dtype)
+            else:
+                out[len(audio_data):] = 0
+            out[:len(audio_data)] = audio_data
+            return out
+        return audio_data
+
+    def _open_decoder(self, path: str, frame_pool: FramePool = None, image_format: str = 'bgr24'):
+        """
+        Opens the fastest available frame decoder for the file: the GPU decode block via ffmpeg
+        when the installed ffmpeg supports one, else the software VideoGear/cv2 path.
+        Only the ffmpeg reader can emit yuv420p natively; the cv2 path always decodes to BGR
+        and the caller converts.
+        """
+        hwaccel = pick_hwaccel()
+        if hwaccel is not None and self.width and self.height and self.frame_rate:
+            try:
+                return FFmpegFrameReader(
+                    path, width=int(self.width), height=int(self.height),
+                    frame_rate=self.frame_rate, hwaccel=hwaccel, frame_pool=frame_pool,
+                    pix_fmt=image_format
+                )
+            except Exception as e:
+                print(f"Hardware decode via {hwaccel} failed, falling back to software decode. {e}")
+        return VideoGear(source=path).start()
+
+    def _video_stream_from_path(self, temp_video_file_path: str, include_audio: bool = True,
+                                frame_pool: FramePool = None, audio_dtype: str = 'int16',
+                                image_format: str = 'bgr24'):
+        stream = self._open_decoder(temp_video_file_path, frame_pool=frame_pool, image_format=image_format)
+        # the ffmpeg reader already delivers the requested format; cv2/VideoGear needs a convert
+        convert_to_i420 = image_format == 'yuv420p' and not isinstance(stream, FFmpegFrameReader)
+
+        if include_audio:
+            # Extract and decode the audio_file once; per-frame slicing happens on the numpy array
+            try:
+                samples, samples_per_frame = self._load_audio_samples(temp_video_file_path, stream.framerate)
+                samples = self._convert_audio_dtype(samples, audio_dtype)
+                pad_buf = np.zeros(samples_per_frame, dtype=samples.dtype)
             except:
                 include_audio = False
                 print("Could not extract audio_file from video file. Audio will not be included in the video stream.")
 
         # Initialize frame counter for audio_file and better self.frame count
         frame_count = 0
-        audio_shape = None  # if the audio in a frame is to short or mishaped fill it with silence.
         try:
             while True:
                 # Read frame
                 frame = stream.read()
                 if frame is None:
                     break
+                if convert_to_i420:
+                    frame = cv2.cvtColor(frame, cv2.COLOR_BGR2YUV_I420)
 
                 if not include_audio:
                     yield frame
                     continue
 
-                # Calculate the start and end times for the corresponding audio_file segment
-                start_time = frame_count * audio_per_frame_duration
-                end_time = start_time + audio_per_frame_duration
-                frame_audio = audio[start_time:end_time]
-
-                # Convert audio_file segment to raw data
-                audio_data = np.array(frame_audio.get_array_of_samples())
-
-                # CODE TO DEAL WITH ERRORS AND IMPUTE VALUES
-                # save the first shape of the audio data
-                if audio_shape is None and len(audio_data) > 0:
-                    audio_shape = audio_data.shape
-
-                if audio_data is None:
-                    # sometimes in a frame theres no audio data. Then we need to fill it with silence.
-                    audio_data = np.zeros(audio_shape)
-
-                # impute missing values or cut too long audio arrays
-                if audio_shape is not None:
-                    if len(audio_data) < audio_shape[0]:
-                        audio_data = np.pad(audio_data, (0, audio_shape[0] - len(audio_data)), 'constant')
-                    elif len(audio_data) > audio_shape[0]:
-                        audio_data = audio_data[:audio_shape[0]]
-
-                # Yield the frame and the corresponding audio_file data
-                yield frame, audio_data
+                # Yield the frame and the corresponding audio_file data (zero-copy view)
+                yield frame, self._slice_frame_audio(samples, samples_per_frame, frame_count, out=pad_buf)
 
                 # Increment frame counter
                 frame_count += 1
         finally:
             # Safely close the video stream
             stream.stop()
-            # Remove the temporary video file
-            os.remove(temp_video_file_path)
             # accurate value instead of using cv2.CAP_PROP_FRAME_COUNT
             self.frame_count = frame_count
 
+    def _try_stream_copy_audio(self, export_type: str) -> Union[bytes, None]:
+        """
+        Returns the audio track bytes via ffmpeg stream copy when the container already holds
+        the requested codec -- no decode, no re-encode. Returns None when transcoding is needed.
+        """
+        target = _AUDIO_COPY_TARGETS.get(export_type)
+        if target is None:
+            return None
+        codecs, muxer = target
+        try:
+            with self._as_source() as src:
+                if get_audio_codec_from_file(src) not in codecs:
+                    return None
+                cmd = ["ffmpeg", "-v", "error", "-i", src, "-vn", "-c:a", "copy"]
+                if muxer == "ipod":
+                    # the mp4 muxer needs a seekable output unless fragmented
+                    cmd += ["-movflags", "frag_keyframe+empty_moov"]
+                res = subprocess.run(cmd + ["-f", muxer, "pipe:1"], capture_output=True, timeout=600)
+            if res.returncode == 0 and res.stdout:
+                return res.stdout
+        except Exception:
+            pass
+        return None
+
     @requires('pydub')
     def extract_audio(self, path: str = None, export_type: str = 'mp3') -> Union[bytes, None]:
-        temp_video_file_path = self._to_temp_file()
-        audio = AudioSegment.from_file(temp_video_file_path)
+        # stream-copy when the codec already matches the export type; else transcode via pydub
+        data = self._try_stream_copy_audio(export_type)
+        if data is None:
+            # decode from the cached temp file, not the buffer: pydub would pipe the buffer
+            # through non-seekable stdin, which silently truncates mp4s whose moov atom
+            # sits at the end (ffmpeg's default layout for user files)
+            with self._as_source() as source_path:
+                audio = AudioSegment.from_file(source_path)
+
+            file = BytesIO()
+            file = audio.export(file, format=export_type)
+            data = file.getvalue()
+            file.close()
 
         if path is not None and len(path) > 0:
             dirname = os.path.dirname(path)
             if len(dirname) > 0 and not os.path.isdir(dirname):
                 os.makedirs(dirname)
-            audio.export(path, format=export_type)
-            os.remove(temp_video_file_path)
+            with open(path, "wb") as f:
+                f.write(data)
             return None
 
-        # return as bytes
-        file = BytesIO()
-        file = audio.export(file, format=export_type)
-        file.seek(0)
-        data = file.read()
-        file.close()
-        # remove tempfile
-        os.remove(temp_video_file_path)
         return data
 
     def __iter__(self):
-        return self.to_video_stream()
+        # frames only: plain iteration shouldn't pay for a full audio decode most callers discard.
+        # use iter_with_audio() / to_video_stream() to get (frame, audio) tuples.
+        return self.to_image_stream()
+
+    def iter_with_audio(self):
+        """
+        Iterates (frame, audio_data) tuples. The audio track is decoded once upfront;
+        per-frame chunks are numpy views into it.
+        """
+        return self.to_video_stream(include_audio=True)
 
     def __len__(self):
         return self.frame_count
@@ -2,28 +2,36 @@ import functools
 from importlib.util import find_spec
 from typing import Union
 
-# this is a cache to speed up our checks
-_installed_libs = []
+# caches so each library is looked up at most once per process
+_installed_libs = set()
+_missing_libs = set()
+
+
+def _is_installed(requirement: str) -> bool:
+    if requirement in _installed_libs:
+        return True
+    if requirement in _missing_libs:
+        return False
+    if find_spec(requirement) is None:
+        _missing_libs.add(requirement)
+        return False
+    _installed_libs.add(requirement)
+    return True
 
 
 def requirement_decorator(requirement: str):
     """
-    Decorator to require a library.
+    Decorator to require a library. The check runs once at decoration time: if the library
+    is installed the function is returned unchanged (zero per-call overhead), otherwise a
+    stub that raises ImportError on use is returned.
     """
     def decorator(func):
+        if _is_installed(requirement):
+            return func
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            # did we already check for the requirement
-            if requirement in _installed_libs:
-                return func(*args, **kwargs)
-
-            # find in modules
-            spec = find_spec(requirement)
-            if spec is None:
-                raise ImportError(f"{requirement} is not installed. Please install {requirement} to use this function.")
-            _installed_libs.append(requirement)
-
-            return func(*args, **kwargs)
+            raise ImportError(f"{requirement} is not installed. Please install {requirement} to use this function.")
         return wrapper
     return decorator
 
@@ -35,7 +43,8 @@ def requires_cv2():
 
 def requires(requirements: Union[list, tuple, str], *args):
     """
-    Decorator to require multiple libraries.
+    Decorator to require multiple libraries. All requirements are checked (previously only
+    the last one was); when everything is installed the function is returned as-is.
     """
     if isinstance(requirements, str):
         requirements = [requirements]
@@ -45,9 +54,14 @@ def requires(requirements: Union[list, tuple, str], *args):
     for arg in args:
         requirements.append(arg)
 
-    req_func = lambda x: x  # identity function if no reqs given
-    for req in requirements:
-        req_func = requirement_decorator(req)
-
-    return req_func
+    def decorator(func):
+        missing = [req for req in requirements if not _is_installed(req)]
+        if not missing:
+            return func
 
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            raise ImportError(f"{', '.join(missing)} is not installed. "
+                              f"Please install {', '.join(missing)} to use this function.")
+        return wrapper
+    return decorator
@@ -0,0 +1,21 @@
+import json
+import subprocess
+from typing import Union
+
+
+def ffprobe_json(path: str) -> Union[dict, None]:
+    """
+    Probes format and stream metadata with a single ffprobe invocation and returns the parsed
+    JSON dict ({"format": ..., "streams": [...]}). One subprocess, one json.loads -- no
+    text-output parsing. Returns None when ffprobe is unavailable or cannot read the file.
+    """
+    try:
+        res = subprocess.run(
+            ["ffprobe", "-v", "quiet", "-print_format", "json", "-show_format", "-show_streams", path],
+            capture_output=True, timeout=30
+        )
+        if res.returncode != 0:
+            return None
+        return json.loads(res.stdout or b"{}") or None
+    except Exception:
+        return None
@@ -1,7 +1,15 @@
 import os.path
 from typing import Union
-import mimetypes
 from media_toolkit import MediaFile, ImageFile, AudioFile, VideoFile
+from media_toolkit.core.media_file import _guess_content_type
+
+
+# built once at import; maps the mime major type to the media-file class
+_FILE_TYPES = {
+    "image": ImageFile,
+    "audio": AudioFile,
+    "video": VideoFile,
+}
 
 
 def guess_file_type(file_path: str) -> str:
@@ -15,8 +23,9 @@ def guess_file_type(file_path: str) -> str:
     if not os.path.exists(file_path) or not os.path.isfile(file_path):
         raise FileNotFoundError(f"file_path does not exist or is not a file: {file_path}")
 
-    type_guess = mimetypes.guess_type(file_path)
-    return type_guess[0]
+    # memoized extension lookup shared with MediaFile; skips the mimetypes DB walk per file
+    ext = os.path.splitext(file_path)[1].lstrip('.').lower()
+    return _guess_content_type(ext)
 
 
 def media_from_file(file_path: str) -> Union[MediaFile, ImageFile, AudioFile, VideoFile]:
@@ -71,19 +80,9 @@ def media_from_file_result(file_result: dict):
         content = file_result.get('content', file_result)
         return MediaFile().from_any(content)
 
-    # determine target class from file type
-    content_type = content_type.lower()
-    file_types = {
-        "octet-stream": MediaFile,
-        "image": ImageFile,
-        "audio_file": AudioFile,
-        "video": VideoFile
-    }
-    # fancy way to write efficient the factory conversion
-    target_class = next(
-        filter(lambda ft: ft[0] in content_type, file_types.items()),
-        (None, MediaFile) # return tuple as default because next returns key, value
-    )[1]
+    # determine target class from the mime major type; anything else (octet-stream, ...) stays MediaFile
+    major_type = content_type.lower().split('/', 1)[0]
+    target_class = _FILE_TYPES.get(major_type, MediaFile)
 
     return target_class().from_dict(file_result)
 
@@ -1,3 +1,63 @@
+import queue
+import threading
+
+
+def prefetch_generator(generator, buffer_size: int):
+    """
+    Runs the generator in a background producer thread and keeps up to buffer_size items ready
+    in a bounded queue. Exceptions from the producer are re-raised in the consumer. When the
+    consumer abandons the stream early (break / GeneratorExit), the producer is signalled and
+    the inner generator is closed so its cleanup (e.g. decoder teardown) still runs.
+    """
+    q = queue.Queue(maxsize=buffer_size)
+    stop = threading.Event()
+    _sentinel = object()
+
+    def _put(item) -> bool:
+        # bounded puts poll the stop flag so an abandoned consumer can't pin the thread
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce():
+        try:
+            for item in generator:
+                if not _put(item):
+                    return
+            _put(_sentinel)
+        except BaseException as e:
+            _put(e)
+        finally:
+            # run the inner generator's finally blocks in this thread, where it lives
+            close = getattr(generator, "close", None)
+            if close is not None:
+                close()
+
+    thread = threading.Thread(target=_produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = q.get()
+            if item is _sentinel:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        # unblock a producer stuck in q.put so its cleanup can run
+        try:
+            while True:
+                q.get_nowait()
+        except queue.Empty:
+            pass
+        thread.join(timeout=5)
+
+
 class SimpleGeneratorWrapper:
     """
     Transforms a generator function into an iterable object with a length property.